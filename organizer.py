@@ -6,14 +6,85 @@
 
 import os
 import sys
+import errno
+import concurrent.futures
 import shutil
 import logging
 import json
+import functools
+import argparse
 from datetime import datetime
 
+# Shared by every function in this module; the handlers are added by setup_logging().
+logger = logging.getLogger("organizer")
+
+# The io_uring backend is optional; without it, moves run on a thread pool.
+try:
+    import organizer_iouring
+except ImportError:
+    organizer_iouring = None
+
+# orjson parses categories.json several times faster when it is installed;
+# otherwise the standard json module does the job. Both are given the same
+# decoded text, so a config loads the same way whichever one is used, and
+# orjson's JSONDecodeError is a subclass of json's, so callers handle either.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# The absolute path of this script, computed once so the directory scan
+# doesn't have to resolve it again for every entry it checks.
+SCRIPT_PATH = os.path.abspath(__file__)
+SCRIPT_NAME = os.path.basename(SCRIPT_PATH)
+
+# Moving a file is almost all waiting on the filesystem, so several
+# moves can be in flight at once without competing for the CPU.
+MAX_MOVE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# io_uring rename failures that move_file() knows how to handle itself.
+IOURING_RETRY_ERRNOS = {errno.EXDEV, errno.EINVAL}
+
+# The menu never changes, so it is built once here rather than on every loop of main().
+MENU_TEXT = """\
+============================================
+           File Organizer Menu            
+============================================
+ORGANIZE (MOVE FILES):
+  1. In the CURRENT folder
+  2. In the PARENT folder
+  3. In a SPECIFIC folder
+
+LIST FILES:
+  4. In the CURRENT folder
+  5. In the PARENT folder
+  6. In a SPECIFIC folder
+
+PLAN ORGANIZATION (DRY RUN):
+  7. In the CURRENT folder
+  8. In the PARENT folder
+  9. In a SPECIFIC folder
+
+--------------------------------------------
+  10. Exit
+============================================"""
+
+# Menu choices grouped by target folder and by action.
+CURRENT_DIR_CHOICES = frozenset({'1', '4', '7'})
+PARENT_DIR_CHOICES = frozenset({'2', '5', '8'})
+SPECIFIC_DIR_CHOICES = frozenset({'3', '6', '9'})
+ORGANIZE_CHOICES = frozenset({'1', '2', '3'})
+LIST_CHOICES = frozenset({'4', '5', '6'})
+DRY_RUN_CHOICES = frozenset({'7', '8', '9'})
+
 # Configure logging
-def setup_logging():
-    """Set up logging configuration for file operations."""
+def setup_logging(quiet=False):
+    """Set up logging configuration for file operations.
+
+    When quiet is True, only warnings and errors are logged to the console;
+    the log file still records everything.
+    """
     # Create logs directory if it doesn't exist
     if not os.path.exists('logs'):
         os.makedirs('logs')
@@ -22,70 +93,115 @@ def setup_logging():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_filename = f"logs/organizer_{timestamp}.log"
     
+    # Also log to console, except for the per-file INFO records in quiet mode
+    console_handler = logging.StreamHandler()
+    if quiet:
+        console_handler.setLevel(logging.WARNING)
+
     # Configure logging format
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
             logging.FileHandler(log_filename),
-            logging.StreamHandler()  # Also log to console
+            console_handler
         ]
     )
     
-    logger = logging.getLogger(__name__)
     logger.info("FileOrganizer session started")
-    logger.info(f"Log file: {log_filename}")
+    logger.info("Log file: %s", log_filename)
     return logger
 
-def load_categories():
-    """Load file categories from the configuration file."""
-    config_file = "categories.json"
-    
+def load_categories(config_file="categories.json"):
+    """Load file categories from the configuration file.
+
+    The returned dictionary may be shared with other callers, so it must not be modified.
+    """
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            categories = json.load(f)
-        logger = logging.getLogger(__name__)
-        logger.info(f"Loaded categories from {config_file}")
+        config_stat = os.stat(config_file)
+        categories = read_categories_file(os.path.abspath(config_file), config_stat.st_mtime_ns, config_stat.st_size)
+        logger.info("Loaded categories from %s", config_file)
         return categories
     except FileNotFoundError:
-        logger = logging.getLogger(__name__)
-        logger.error(f"Configuration file '{config_file}' not found. Please ensure it exists.")
+        logger.error("Configuration file '%s' not found. Please ensure it exists.", config_file)
         raise FileNotFoundError(f"Required configuration file '{config_file}' is missing. Please check the project directory.")
     except json.JSONDecodeError as e:
-        logger = logging.getLogger(__name__)
-        logger.error(f"Invalid JSON in {config_file}: {e}")
+        logger.error("Invalid JSON in %s: %s", config_file, e)
         raise json.JSONDecodeError(f"Configuration file '{config_file}' contains invalid JSON. Please check the file format.", config_file, 0)
     except IOError as e:
-        logger = logging.getLogger(__name__)
-        logger.error(f"Error reading {config_file}: {e}")
+        logger.error("Error reading %s: %s", config_file, e)
         raise IOError(f"Unable to read configuration file '{config_file}': {e}")
 
-# This dictionary acts as the "rulebook" for the organization.
-# - The "keys" (e.g., "Images") are the names of the folders that will be created.
-# - The "values" are lists of file extensions (in lowercase) that belong to that category.
-# - You can easily customize this list by editing the categories.json file.
+@functools.lru_cache(maxsize=4)
+def read_categories_file(config_path, mtime_ns, size):
+    """Parses a categories file, reusing the result while its modification time and size are unchanged."""
+    # The parsed categories aren't cached in a file between runs: the cache would
+    # have to sit next to categories.json, in the working directory the menu
+    # organizes, and it would only save a few microseconds per start.
+    # Decode here rather than letting the parser sniff the bytes: Notepad saves UTF-8
+    # with a byte order mark, which 'utf-8-sig' drops, and anything that isn't UTF-8
+    # fails the same way with either parser.
+    with open(config_path, 'r', encoding='utf-8-sig') as f:
+        return json_loads(f.read())
 
-def get_files_to_organize(target_dir):
-    """Scans a directory and returns a list of files to be organized."""
+def build_extension_index(categories):
+    """Inverts the categories dictionary into an extension -> category lookup table."""
+    # A plain dict stays fast however many extensions categories.json lists: the
+    # extension is cut from the file name first, so classifying a file is one hash
+    # lookup. A combined regex or DFA (e.g. Hyperscan) would have to scan every file
+    # name instead, and would add a compiled dependency to a standard-library-only script.
+    extension_index = {}
+    for category, extensions in categories.items():
+        for ext in extensions:
+            # Some extensions are listed under more than one category (e.g. '.csv').
+            # Keep the first category, just like the original top-to-bottom search did.
+            # File extensions are lowercased before lookup, so lowercase the config's too
+            # in case it lists one like '.JPG'.
+            extension_index.setdefault(ext.lower(), category)
+    return extension_index
+
+def get_file_extension(filename):
+    """Returns the lowercase extension of a file name (e.g. '.jpg'), or '' if it has none."""
+    head, dot, tail = filename.rpartition('.')
+    # Leading dots mark hidden files (e.g. '.gitignore'), not extensions,
+    # which matches how os.path.splitext() treats them.
+    if not dot or not head.strip('.'):
+        return ''
+    return '.' + tail.lower()
+
+def scan_directory(target_dir):
+    """Scans a directory and returns (DirEntry, extension) pairs for the files to be organized.
+
+    The DirEntry objects carry the file type (and, on Windows, the stat details) read
+    along with the directory listing, so callers never need to stat the files again.
+    """
+    entries = []
     try:
-        # Get a list of all items (files and folders) in the target directory.
-        all_items = os.listdir(target_dir)
-    except FileNotFoundError:
-        # If the directory doesn't exist, return None to indicate an error.
+        # os.scandir() reports each entry's type from the directory listing itself,
+        # so we don't need a separate stat() call per item to find the files.
+        with os.scandir(target_dir) as it:
+            for entry in it:
+                # Check if the item is a file.
+                # CRITICAL CHECK: Also check that the file is not this script itself.
+                # We compare the absolute paths to ensure it works correctly everywhere,
+                # but only for entries whose name matches the script's own name.
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.name == SCRIPT_NAME and os.path.abspath(entry.path) == SCRIPT_PATH:
+                    continue
+                # Extract the file extension (e.g., '.jpg') and convert to lowercase.
+                entries.append((entry, get_file_extension(entry.name)))
+    except (FileNotFoundError, NotADirectoryError):
+        # If the directory doesn't exist (or is a file), return None to indicate an error.
         return None
+    return entries
 
-    files = []
-    # Loop through every item found in the directory.
-    for item in all_items:
-        # Create the full path for the item.
-        item_path = os.path.join(target_dir, item)
-        
-        # Check if the item is a file.
-        # CRITICAL CHECK: Also check that the file is not this script itself.
-        # We compare the absolute paths to ensure it works correctly everywhere.
-        if os.path.isfile(item_path) and os.path.abspath(item_path) != os.path.abspath(__file__):
-            files.append(item)
-    return files
+def get_files_to_organize(target_dir):
+    """Scans a directory and returns a list of files to be organized."""
+    entries = scan_directory(target_dir)
+    if entries is None:
+        return None
+    return [entry.name for entry, _ in entries]
 
 def list_available_files(target_dir):
     """Handles Menu Options 4, 5, 6: Lists all organizable files."""
@@ -100,165 +216,339 @@ def list_available_files(target_dir):
     # Handle case where there are no files to list.
     if not files:
         print("No files to list in this directory.")
-    else:
-        for filename in files:
-            print(f"  - {filename}")
-    print("-----------------------------------------------------\n")
+        print("-----------------------------------------------------\n")
+        return
+
+    # Print the whole listing at once; one print() per file is slow for big folders.
+    output_lines = [f"  - {filename}" for filename in files]
+    output_lines.append("-----------------------------------------------------\n")
+    print("\n".join(output_lines))
 
-def perform_organization(target_dir, is_dry_run, categories):
-    """Handles Menu Options 1, 2, 3, 7, 8, 9: Performs the dry run or the actual organization."""
-    logger = logging.getLogger(__name__)
+def perform_organization(target_dir, is_dry_run, categories, quiet=False, extension_index=None):
+    """Handles Menu Options 1, 2, 3, 7, 8, 9: Performs the dry run or the actual organization.
+
+    When quiet is True, only errors are printed for individual files; everything is still logged.
+    An extension_index from build_extension_index(categories) can be passed in to avoid
+    rebuilding it on every call.
+    """
+    abs_target_dir = os.path.abspath(target_dir)
     
     # Set the header message based on whether it's a dry run or a real one.
-    header = f"--- Dry Run: Planning organization in: {os.path.abspath(target_dir)} ---"
+    header = f"--- Dry Run: Planning organization in: {abs_target_dir} ---"
     if not is_dry_run:
-        header = f"--- Organizing files in: {os.path.abspath(target_dir)} ---"
+        header = f"--- Organizing files in: {abs_target_dir} ---"
     print(f"\n{header}")
     
     # Log the operation start
     operation_type = "DRY RUN" if is_dry_run else "ORGANIZATION"
-    logger.info(f"{operation_type} started in directory: {os.path.abspath(target_dir)}")
+    logger.info("%s started in directory: %s", operation_type, abs_target_dir)
 
-    files_to_organize = get_files_to_organize(target_dir)
+    files_to_organize = scan_directory(target_dir)
     if files_to_organize is None:
         error_msg = f"Error: Directory not found."
         print(error_msg)
-        logger.error(f"Directory not found: {os.path.abspath(target_dir)}")
+        logger.error("Directory not found: %s", abs_target_dir)
         return
 
     if not files_to_organize:
         info_msg = "No files to organize in this directory."
         print(info_msg)
-        logger.info(f"No files found to organize in: {os.path.abspath(target_dir)}")
+        logger.info("No files found to organize in: %s", abs_target_dir)
         return
 
-    logger.info(f"Found {len(files_to_organize)} files to process")
+    logger.info("Found %d files to process", len(files_to_organize))
 
-    # Process each file one by one.
-    for filename in files_to_organize:
-        # Extract the file extension (e.g., '.jpg') and convert to lowercase.
-        file_ext = os.path.splitext(filename)[1].lower()
-        
+    # Checked once so the per-file INFO messages cost nothing when INFO is disabled.
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    if extension_index is None:
+        extension_index = build_extension_index(categories)
+
+    # First pass: look up the category for each file's extension.
+    # Unknown extensions are a single failed dict lookup (None), so there's no
+    # separate cache for them; a module-level cache keyed only by extension would
+    # also return stale answers when this is called with different categories.
+    # This pass does no I/O, so it runs as one tight comprehension with the
+    # lookup method bound to a local name.
+    lookup_category = extension_index.get
+    plans = [(entry.name, file_ext, lookup_category(file_ext))
+             for entry, file_ext in files_to_organize]
+
+    # Work out each destination folder's path once, rather than once per file.
+    needed_categories = dict.fromkeys(category for _, _, category in plans if category is not None)
+    dest_folders = {category: os.path.join(target_dir, category) for category in needed_categories}
+
+    # Create each destination folder once up front, rather than once per file.
+    failed_categories = set()
+    if not is_dry_run:
+        for category, dest_folder_path in dest_folders.items():
+            try:
+                os.makedirs(dest_folder_path, exist_ok=True)
+            except OSError as e:
+                error_msg = f"  - ERROR creating the '{category}' folder: {e}"
+                print(error_msg)
+                logger.error("Could not create '%s' folder at %s: %s", category, dest_folder_path, e)
+                failed_categories.add(category)
+
+    # Move all the files first; the results are reported below in the original file order.
+    move_errors = {}
+    if not is_dry_run:
+        moves = [(filename, category)
+                 for filename, file_ext, category in plans
+                 if file_ext and category is not None and category not in failed_categories]
+        move_errors = move_files(target_dir, moves)
+
+    # The per-file messages are collected here and printed with a single call at the
+    # end, instead of writing (and flushing) the console once per file.
+    output_lines = []
+
+    # Second pass: report on each file one by one.
+    for filename, file_ext, category in plans:
         # Skip files that have no extension.
         if not file_ext:
             skip_msg = f"  - Skipping '{filename}' (no file extension)."
-            print(skip_msg)
-            logger.info(f"Skipped file without extension: {filename}")
+            if not quiet:
+                output_lines.append(skip_msg)
+            if log_info:
+                logger.info("Skipped file without extension: %s", filename)
             continue
 
-        # Search for the extension in our categories dictionary.
-        found_category = False
-        for category, extensions in categories.items():
-            if file_ext in extensions:
-                # If a match is found, prepare the source and destination paths.
-                dest_folder_path = os.path.join(target_dir, category)
-                source_file_path = os.path.join(target_dir, filename)
-
-                # This is the main logic branch: either plan or execute the move.
-                if is_dry_run:
-                    # DRY RUN: Just print the plan.
-                    plan_msg = f"  - Plan: Move '{filename}' to '{category}' folder."
-                    print(plan_msg)
-                    logger.info(f"DRY RUN: Would move '{filename}' to '{category}' folder")
-                else:
-                    # EXECUTION: Try to move the file, with error handling.
-                    try:
-                        os.makedirs(dest_folder_path, exist_ok=True)
-                        shutil.move(source_file_path, dest_folder_path)
-                        success_msg = f"  - Moved '{filename}' to '{category}' folder."
-                        print(success_msg)
-                        logger.info(f"Successfully moved '{filename}' to '{category}' folder at {dest_folder_path}")
-                    except PermissionError:
-                        error_msg = f"  - ERROR moving '{filename}': Permission denied. Suggestion: Check if the file is in use or if you have write permissions."
-                        print(error_msg)
-                        logger.error(f"Permission denied when moving '{filename}' to '{category}' folder")
-                    except FileNotFoundError:
-                        error_msg = f"  - ERROR moving '{filename}': File not found. Suggestion: It may have been moved or deleted by another process."
-                        print(error_msg)
-                        logger.error(f"File not found when attempting to move '{filename}'")
-                    except OSError as e:
-                        if "already exists" in str(e):
-                            skip_msg = f"  - SKIPPED: '{filename}' already exists in the '{category}' folder."
-                            print(skip_msg)
-                            logger.warning(f"File '{filename}' already exists in '{category}' folder - skipped")
-                        else:
-                            error_msg = f"  - ERROR moving '{filename}': An unexpected OS error occurred."
-                            print(error_msg)
-                            print(f"    |--> OS Message: {e}")
-                            print(f"    |--> Instructions:")
-                            print(f"    |    1. Read the 'OS Message' above for specific details.")
-                            print(f"    |    2. Check if the destination drive is full.")
-                            print(f"    |    3. Check if the file path is becoming too long (a common issue on Windows).")
-                            print(f"    |    4. Ensure the filename does not contain characters that are illegal in the destination path.")
-                            logger.error(f"OS error when moving '{filename}': {e}")
-                
-                found_category = True
-                break # Stop searching for categories once one is found.
-        
         # If the file extension was not found in any category, skip the file.
-        if not found_category:
+        if category is None:
             skip_msg = f"  - Skipping '{filename}' (unknown file type '{file_ext}')."
-            print(skip_msg)
-            logger.info(f"Skipped unknown file type: {filename} ({file_ext})")
+            if not quiet:
+                output_lines.append(skip_msg)
+            if log_info:
+                logger.info("Skipped unknown file type: %s (%s)", filename, file_ext)
+            continue
+
+        # Prepare the destination path.
+        dest_folder_path = dest_folders[category]
+
+        # This is the main logic branch: either plan or execute the move.
+        if is_dry_run:
+            # DRY RUN: Just print the plan.
+            plan_msg = f"  - Plan: Move '{filename}' to '{category}' folder."
+            if not quiet:
+                output_lines.append(plan_msg)
+            if log_info:
+                logger.info("DRY RUN: Would move '%s' to '%s' folder", filename, category)
+        elif category in failed_categories:
+            # The destination folder couldn't be created, so there is nowhere to move the file.
+            skip_msg = f"  - SKIPPED: '{filename}' (the '{category}' folder could not be created)."
+            output_lines.append(skip_msg)
+            logger.warning("Skipped '%s' because the '%s' folder could not be created", filename, category)
+        else:
+            # EXECUTION: Check how the move went, with error handling.
+            try:
+                if move_errors[filename] is not None:
+                    raise move_errors[filename]
+                success_msg = f"  - Moved '{filename}' to '{category}' folder."
+                if not quiet:
+                    output_lines.append(success_msg)
+                if log_info:
+                    logger.info("Successfully moved '%s' to '%s' folder at %s", filename, category, dest_folder_path)
+            except FileExistsError:
+                skip_msg = f"  - SKIPPED: '{filename}' already exists in the '{category}' folder."
+                output_lines.append(skip_msg)
+                logger.warning("File '%s' already exists in '%s' folder - skipped", filename, category)
+            except PermissionError:
+                error_msg = f"  - ERROR moving '{filename}': Permission denied. Suggestion: Check if the file is in use or if you have write permissions."
+                output_lines.append(error_msg)
+                logger.error("Permission denied when moving '%s' to '%s' folder", filename, category)
+            except FileNotFoundError:
+                error_msg = f"  - ERROR moving '{filename}': File not found. Suggestion: It may have been moved or deleted by another process."
+                output_lines.append(error_msg)
+                logger.error("File not found when attempting to move '%s'", filename)
+            except OSError as e:
+                error_msg = f"  - ERROR moving '{filename}': An unexpected OS error occurred."
+                output_lines.append(error_msg)
+                output_lines.append(f"    |--> OS Message: {e}")
+                output_lines.append(f"    |--> Instructions:")
+                output_lines.append(f"    |    1. Read the 'OS Message' above for specific details.")
+                output_lines.append(f"    |    2. Check if the destination drive is full.")
+                output_lines.append(f"    |    3. Check if the file path is becoming too long (a common issue on Windows).")
+                output_lines.append(f"    |    4. Ensure the filename does not contain characters that are illegal in the destination path.")
+                logger.error("OS error when moving '%s': %s", filename, e)
 
     # Print a final status message.
     if is_dry_run:
         final_msg = "--- Dry Run Complete. No files were moved. ---"
-        print(final_msg)
+        output_lines.append(final_msg)
         logger.info("DRY RUN completed successfully")
     else:
         final_msg = "--- File Organization Complete. ---"
-        print(final_msg)
+        output_lines.append(final_msg)
         logger.info("File organization completed successfully")
 
+    print("\n".join(output_lines))
+
+def move_file(target_dir, filename, category, dir_fd=None, cross_device=False):
+    """Moves target_dir/filename into the target_dir/category folder with a single rename.
+
+    If dir_fd is an open descriptor for target_dir, the paths are resolved relative
+    to it, so the kernel doesn't walk the whole target_dir path again for every file.
+    When the folder is on a different drive the file is copied and then deleted instead;
+    pass cross_device=True if that is already known, to skip the rename that would fail.
+    """
+    if dir_fd is None:
+        source_file_path = os.path.join(target_dir, filename)
+        dest_file_path = os.path.join(target_dir, category, filename)
+    else:
+        source_file_path = filename
+        dest_file_path = os.path.join(category, filename)
+
+    # os.rename() silently replaces an existing file on some platforms,
+    # so refuse to overwrite anything that is already at the destination.
+    try:
+        os.lstat(dest_file_path, dir_fd=dir_fd)
+    except FileNotFoundError:
+        pass
+    else:
+        raise FileExistsError(errno.EEXIST, "Destination path already exists", dest_file_path)
+
+    if not cross_device:
+        try:
+            os.rename(source_file_path, dest_file_path, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+            return
+        except OSError as e:
+            # A rename can't cross filesystems; copy the file instead.
+            if e.errno != errno.EXDEV:
+                raise
+    # This is what shutil.move() does once its own rename has failed.
+    shutil.copy2(os.path.join(target_dir, filename), os.path.join(target_dir, category, filename))
+    os.unlink(os.path.join(target_dir, filename))
+
+def find_cross_device_categories(target_dir, categories):
+    """Returns the categories whose folder is on a different filesystem from target_dir."""
+    # One stat per folder tells us up front which moves can't be renames (for
+    # example a category folder that is a mount point), so those files skip
+    # straight to copying instead of each trying a rename that fails with EXDEV.
+    try:
+        target_dev = os.stat(target_dir).st_dev
+    except OSError:
+        return set()
+    cross_device = set()
+    for category in categories:
+        try:
+            if os.stat(os.path.join(target_dir, category)).st_dev != target_dev:
+                cross_device.add(category)
+        except OSError:
+            # Let the move itself report the problem with this folder.
+            pass
+    return cross_device
+
+def open_directory_fd(target_dir):
+    """Returns a descriptor for target_dir to rename files relative to, or None if unsupported."""
+    # Windows can't rename or stat relative to a directory descriptor.
+    if os.rename not in os.supports_dir_fd or os.stat not in os.supports_dir_fd:
+        return None
+    try:
+        return os.open(target_dir, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+    except OSError:
+        return None
+
+def move_files(target_dir, moves):
+    """Moves (filename, category) pairs from target_dir into their category folders.
+
+    Returns a dictionary mapping each filename to None if it was moved, or to
+    the exception that stopped it from being moved.
+    """
+    move_errors = {}
+    categories = {category for _, category in moves}
+    cross_device = find_cross_device_categories(target_dir, categories)
+
+    # On Linux 5.11+, hand the whole batch to the kernel through io_uring.
+    # Folders on another filesystem can't be renamed into, so those are left for move_file().
+    rename_moves = [move for move in moves if move[1] not in cross_device]
+    if rename_moves and organizer_iouring is not None and organizer_iouring.is_available():
+        # Join each category's folder prefix once, then build the paths by concatenation.
+        category_prefixes = {category: os.path.join(category, '') for category in categories}
+        renames = [(filename, category_prefixes[category] + filename) for filename, category in rename_moves]
+        try:
+            results = organizer_iouring.rename_batch(target_dir, renames)
+        except OSError:
+            # The ring couldn't be set up; fall back to the thread pool for everything.
+            results = []
+        for (filename, category), error in zip(rename_moves, results):
+            if isinstance(error, organizer_iouring.RenameOutcomeUnknown):
+                # The ring failed after this rename was submitted, so it may have
+                # happened or may even still be running. Retrying could race it, so
+                # only check whether the file has arrived and otherwise report the error.
+                if (not os.path.lexists(os.path.join(target_dir, filename))
+                        and os.path.lexists(os.path.join(target_dir, category, filename))):
+                    error = None
+                move_errors[filename] = error
+            # Cross-device moves, unsupported renames and renames the ring never
+            # got to (EINVAL) are retried through move_file() below.
+            elif error is None or error.errno not in IOURING_RETRY_ERRNOS:
+                move_errors[filename] = error
+
+    # Run any remaining moves on a thread pool so the rename calls overlap.
+    # Leaving the "with" block waits for all of them to finish.
+    remaining = [move for move in moves if move[0] not in move_errors]
+    if remaining:
+        dir_fd = open_directory_fd(target_dir)
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_MOVE_WORKERS) as executor:
+                futures = {}
+                for filename, category in remaining:
+                    futures[filename] = executor.submit(move_file, target_dir, filename, category, dir_fd,
+                                                        category in cross_device)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        for filename, future in futures.items():
+            move_errors[filename] = future.exception()
+    return move_errors
+
 def get_target_dir_from_user():
     """Handles Menu Options 3, 6, 9: Prompts user for a specific directory and validates it."""
     path = input("Enter the full path to the specific folder: ").strip()
-    if not os.path.isdir(path):
+    # Opening the directory checks that it exists and that it can actually be listed,
+    # in the same single path lookup that os.path.isdir() would have done.
+    try:
+        with os.scandir(path):
+            pass
+    except (FileNotFoundError, NotADirectoryError):
         print(f"\nError: The directory '{path}' does not exist. Returning to main menu.\n")
         return None
+    except OSError as e:
+        print(f"\nError: The directory '{path}' cannot be read ({e.strerror}). Returning to main menu.\n")
+        return None
     return path
 
 def main():
     """The main function that runs the interactive menu loop."""
+    parser = argparse.ArgumentParser(description="Organize files into subfolders based on their file type.")
+    parser.add_argument("--quiet", action="store_true",
+                        help="only print errors and warnings for individual files (the log file still records everything)")
+    args = parser.parse_args()
+
     # Set up logging
-    logger = setup_logging()
+    logger = setup_logging(quiet=args.quiet)
     
     # Load categories from config file
     categories = load_categories()
+
+    # Build the extension lookup table once, rather than on every menu action.
+    extension_index = build_extension_index(categories)
     
     # The main loop runs forever until the user chooses to exit.
     while True:
         # Step 1: Display the menu of options.
-        print("============================================")
-        print("           File Organizer Menu            ")
-        print("============================================")
-        print("ORGANIZE (MOVE FILES):")
-        print("  1. In the CURRENT folder")
-        print("  2. In the PARENT folder")
-        print("  3. In a SPECIFIC folder")
-        print("\nLIST FILES:")
-        print("  4. In the CURRENT folder")
-        print("  5. In the PARENT folder")
-        print("  6. In a SPECIFIC folder")
-        print("\nPLAN ORGANIZATION (DRY RUN):")
-        print("  7. In the CURRENT folder")
-        print("  8. In the PARENT folder")
-        print("  9. In a SPECIFIC folder")
-        print("\n--------------------------------------------")
-        print("  10. Exit")
-        print("============================================")
+        print(MENU_TEXT)
         
         # Step 2: Get the user's choice.
         choice = input("Enter your choice (1-10): ").strip()
 
         # Step 3: Determine the target directory based on the user's choice.
         target_dir = None
-        if choice in ['1', '4', '7']:
+        if choice in CURRENT_DIR_CHOICES:
             target_dir = "."  # Current directory
-        elif choice in ['2', '5', '8']:
+        elif choice in PARENT_DIR_CHOICES:
             target_dir = ".." # Parent directory
-        elif choice in ['3', '6', '9']:
+        elif choice in SPECIFIC_DIR_CHOICES:
             target_dir = get_target_dir_from_user()
         elif choice == '10':
             print("Exiting.")
@@ -272,15 +562,17 @@ def main():
             continue
 
         # Step 4: Call the appropriate function based on the user's choice.
-        if choice in ['1', '2', '3']:
+        if choice in ORGANIZE_CHOICES:
             # These are the "Organize" options.
-            perform_organization(target_dir, is_dry_run=False, categories=categories)
-        elif choice in ['4', '5', '6']:
+            perform_organization(target_dir, is_dry_run=False, categories=categories, quiet=args.quiet,
+                                 extension_index=extension_index)
+        elif choice in LIST_CHOICES:
             # These are the "List" options.
             list_available_files(target_dir)
-        elif choice in ['7', '8', '9']:
+        elif choice in DRY_RUN_CHOICES:
             # These are the "Dry Run" options.
-            perform_organization(target_dir, is_dry_run=True, categories=categories)
+            perform_organization(target_dir, is_dry_run=True, categories=categories, quiet=args.quiet,
+                                 extension_index=extension_index)
 
 # This is a standard Python convention. 
 # It ensures that the main() function is called only when the script is executed directly.
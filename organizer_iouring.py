@@ -0,0 +1,325 @@
+# ==============================================================================
+# FileOrganizer io_uring Backend
+# Description: An optional Linux-only backend that hands a whole batch of
+#              renames to the kernel at once through io_uring, instead of
+#              making one rename() system call per file.
+# ==============================================================================
+
+import os
+import sys
+import re
+import platform
+import errno
+import ctypes
+
+# System call numbers for 64-bit x86. Most newer architectures share these, but
+# not all of them (alpha and MIPS add offsets, and x32 sets a high bit), so the
+# backend is limited to SUPPORTED_MACHINES instead of guessing.
+SYS_IO_URING_SETUP = 425
+SYS_IO_URING_ENTER = 426
+
+# The completion and submission rings are shared with the kernel, and liburing
+# reads and writes their head/tail indexes with acquire/release barriers. ctypes
+# has no way to issue those, so the backend only runs on x86-64, whose memory
+# model (TSO) already keeps these plain loads and stores in order. On weakly
+# ordered CPUs such as aarch64 a stale completion could be read and its result
+# attached to the wrong file.
+SUPPORTED_MACHINES = {"x86_64", "amd64"}
+
+# Offsets used to mmap() the rings and the submission queue entries (SQEs).
+IORING_OFF_SQ_RING = 0
+IORING_OFF_CQ_RING = 0x8000000
+IORING_OFF_SQES = 0x10000000
+
+IORING_FEAT_SINGLE_MMAP = 1 << 0
+IORING_ENTER_GETEVENTS = 1 << 0
+IORING_OP_RENAMEAT = 35
+
+# Ask the kernel to fail with EEXIST rather than replace an existing file.
+RENAME_NOREPLACE = 1 << 0
+
+# IORING_OP_RENAMEAT was added in Linux 5.11.
+MIN_KERNEL_VERSION = (5, 11)
+
+# How many renames are submitted with a single io_uring_enter() call.
+RING_ENTRIES = 256
+
+PROT_READ = 0x1
+PROT_WRITE = 0x2
+MAP_SHARED = 0x01
+MAP_POPULATE = 0x08000
+
+class SQRingOffsets(ctypes.Structure):
+    _fields_ = [
+        ("head", ctypes.c_uint32),
+        ("tail", ctypes.c_uint32),
+        ("ring_mask", ctypes.c_uint32),
+        ("ring_entries", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("dropped", ctypes.c_uint32),
+        ("array", ctypes.c_uint32),
+        ("resv1", ctypes.c_uint32),
+        ("user_addr", ctypes.c_uint64),
+    ]
+
+class CQRingOffsets(ctypes.Structure):
+    _fields_ = [
+        ("head", ctypes.c_uint32),
+        ("tail", ctypes.c_uint32),
+        ("ring_mask", ctypes.c_uint32),
+        ("ring_entries", ctypes.c_uint32),
+        ("overflow", ctypes.c_uint32),
+        ("cqes", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("resv1", ctypes.c_uint32),
+        ("user_addr", ctypes.c_uint64),
+    ]
+
+class Params(ctypes.Structure):
+    """Mirrors struct io_uring_params from <linux/io_uring.h>."""
+    _fields_ = [
+        ("sq_entries", ctypes.c_uint32),
+        ("cq_entries", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("sq_thread_cpu", ctypes.c_uint32),
+        ("sq_thread_idle", ctypes.c_uint32),
+        ("features", ctypes.c_uint32),
+        ("wq_fd", ctypes.c_uint32),
+        ("resv", ctypes.c_uint32 * 3),
+        ("sq_off", SQRingOffsets),
+        ("cq_off", CQRingOffsets),
+    ]
+
+class SQE(ctypes.Structure):
+    """Mirrors struct io_uring_sqe, laid out for a rename request."""
+    _fields_ = [
+        ("opcode", ctypes.c_uint8),
+        ("flags", ctypes.c_uint8),
+        ("ioprio", ctypes.c_uint16),
+        ("fd", ctypes.c_int32),         # Old directory fd
+        ("addr2", ctypes.c_uint64),     # New path
+        ("addr", ctypes.c_uint64),      # Old path
+        ("len", ctypes.c_uint32),       # New directory fd
+        ("rename_flags", ctypes.c_uint32),
+        ("user_data", ctypes.c_uint64),
+        ("buf_index", ctypes.c_uint16),
+        ("personality", ctypes.c_uint16),
+        ("splice_fd_in", ctypes.c_int32),
+        ("addr3", ctypes.c_uint64),
+        ("pad2", ctypes.c_uint64),
+    ]
+
+class CQE(ctypes.Structure):
+    """Mirrors struct io_uring_cqe."""
+    _fields_ = [
+        ("user_data", ctypes.c_uint64),
+        ("res", ctypes.c_int32),
+        ("flags", ctypes.c_uint32),
+    ]
+
+class RenameOutcomeUnknown(OSError):
+    """A rename was submitted to the kernel, but the ring failed before its result was read.
+
+    The rename may have happened, may not have, or may still be running.
+    """
+
+_libc = None
+_available = None
+
+def _get_libc():
+    """Loads the C library with the argument types used by this module."""
+    global _libc
+    if _libc is None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.syscall.restype = ctypes.c_long
+        libc.mmap.restype = ctypes.c_void_p
+        libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_long]
+        libc.munmap.restype = ctypes.c_int
+        libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        _libc = libc
+    return _libc
+
+def _kernel_version():
+    """Returns the running kernel's (major, minor) version, or (0, 0) if unknown."""
+    match = re.match(r"(\d+)\.(\d+)", os.uname().release)
+    if not match:
+        return (0, 0)
+    return (int(match.group(1)), int(match.group(2)))
+
+class Ring:
+    """A minimal io_uring instance that only knows how to submit renames."""
+
+    def __init__(self, entries=RING_ENTRIES):
+        self._libc = _get_libc()
+        self._maps = []
+        params = Params()
+        fd = self._libc.syscall(ctypes.c_long(SYS_IO_URING_SETUP), ctypes.c_uint(entries), ctypes.byref(params))
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.fd = fd
+
+        try:
+            sq_ring_size = params.sq_off.array + params.sq_entries * ctypes.sizeof(ctypes.c_uint32)
+            cq_ring_size = params.cq_off.cqes + params.cq_entries * ctypes.sizeof(CQE)
+            if params.features & IORING_FEAT_SINGLE_MMAP:
+                # Newer kernels share one mapping between both rings.
+                sq_ring_size = cq_ring_size = max(sq_ring_size, cq_ring_size)
+                sq_ring = cq_ring = self._mmap(sq_ring_size, IORING_OFF_SQ_RING)
+            else:
+                sq_ring = self._mmap(sq_ring_size, IORING_OFF_SQ_RING)
+                cq_ring = self._mmap(cq_ring_size, IORING_OFF_CQ_RING)
+            self._sqes = self._mmap(params.sq_entries * ctypes.sizeof(SQE), IORING_OFF_SQES)
+        except OSError:
+            self.close()
+            raise
+
+        self.sq_entries = params.sq_entries
+        self._sq_tail = ctypes.c_uint32.from_address(sq_ring + params.sq_off.tail)
+        self._sq_mask = ctypes.c_uint32.from_address(sq_ring + params.sq_off.ring_mask).value
+        self._sq_array = (ctypes.c_uint32 * params.sq_entries).from_address(sq_ring + params.sq_off.array)
+        self._cq_head = ctypes.c_uint32.from_address(cq_ring + params.cq_off.head)
+        self._cq_tail = ctypes.c_uint32.from_address(cq_ring + params.cq_off.tail)
+        self._cq_mask = ctypes.c_uint32.from_address(cq_ring + params.cq_off.ring_mask).value
+        self._cqes = cq_ring + params.cq_off.cqes
+
+    def _mmap(self, size, offset):
+        """Maps part of the ring into memory and remembers it for close()."""
+        addr = self._libc.mmap(None, size, PROT_READ | PROT_WRITE, MAP_SHARED | MAP_POPULATE, self.fd, offset)
+        if addr is None or addr == ctypes.c_void_p(-1).value:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._maps.append((addr, size))
+        return addr
+
+    def _enter(self, to_submit, min_complete):
+        """Calls io_uring_enter(), retrying if it is interrupted by a signal."""
+        while True:
+            ret = self._libc.syscall(ctypes.c_long(SYS_IO_URING_ENTER), ctypes.c_int(self.fd),
+                                     ctypes.c_uint(to_submit), ctypes.c_uint(min_complete),
+                                     ctypes.c_uint(IORING_ENTER_GETEVENTS), None, ctypes.c_size_t(0))
+            if ret >= 0:
+                return ret
+            err = ctypes.get_errno()
+            if err != errno.EINTR:
+                raise OSError(err, os.strerror(err))
+
+    def rename_chunk(self, dir_fd, renames, first_id, results):
+        """Submits up to sq_entries renames relative to dir_fd and waits for them.
+
+        Appends a (request id, result) pair to `results` as each rename
+        completes, where result is 0 on success or a negative errno value.
+        If io_uring_enter() fails part way, the pairs appended so far are kept.
+        """
+        # Keep the encoded paths alive until the kernel has completed every request.
+        paths = []
+        tail = self._sq_tail.value
+        for offset, (old_name, new_name) in enumerate(renames):
+            old_path = ctypes.create_string_buffer(os.fsencode(old_name))
+            new_path = ctypes.create_string_buffer(os.fsencode(new_name))
+            paths.append((old_path, new_path))
+
+            index = (tail + offset) & self._sq_mask
+            sqe = SQE.from_address(self._sqes + index * ctypes.sizeof(SQE))
+            ctypes.memset(ctypes.addressof(sqe), 0, ctypes.sizeof(SQE))
+            sqe.opcode = IORING_OP_RENAMEAT
+            sqe.fd = dir_fd
+            sqe.addr = ctypes.addressof(old_path)
+            sqe.len = dir_fd
+            sqe.addr2 = ctypes.addressof(new_path)
+            sqe.rename_flags = RENAME_NOREPLACE
+            sqe.user_data = first_id + offset
+            self._sq_array[index] = index
+
+        # On x86-64 (see SUPPORTED_MACHINES) the SQE writes above are visible
+        # to the kernel before this tail store, so no explicit barrier is needed.
+        self._sq_tail.value = (tail + len(renames)) & 0xFFFFFFFF
+
+        pending = len(renames)
+        unsubmitted = len(renames)
+        while pending:
+            submitted = self._enter(unsubmitted, 1)
+            unsubmitted -= min(submitted, unsubmitted)
+            head = self._cq_head.value
+            # Completions keep arriving while this loop runs. Reading the tail
+            # before the CQEs it covers is only safe because x86-64 does not
+            # reorder loads (see SUPPORTED_MACHINES).
+            cq_tail = self._cq_tail.value
+            while head != cq_tail:
+                cqe = CQE.from_address(self._cqes + (head & self._cq_mask) * ctypes.sizeof(CQE))
+                results.append((cqe.user_data, cqe.res))
+                head = (head + 1) & 0xFFFFFFFF
+                pending -= 1
+            self._cq_head.value = head
+
+    def close(self):
+        """Unmaps the rings and closes the io_uring file descriptor."""
+        for addr, size in self._maps:
+            self._libc.munmap(addr, size)
+        self._maps = []
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+def is_available():
+    """Returns True if this system can submit renames through io_uring."""
+    global _available
+    if _available is None:
+        _available = False
+        if (sys.platform.startswith("linux")
+                and platform.machine().lower() in SUPPORTED_MACHINES
+                and ctypes.sizeof(ctypes.c_void_p) == 8  # not the x32 ABI
+                and _kernel_version() >= MIN_KERNEL_VERSION):
+            try:
+                Ring(entries=1).close()
+                _available = True
+            except (OSError, AttributeError):
+                # io_uring can be disabled by sysctl or blocked by a seccomp
+                # filter (common in containers); callers then use another path.
+                pass
+    return _available
+
+def rename_batch(target_dir, renames):
+    """Renames files inside target_dir using io_uring.
+
+    `renames` is a list of (old_name, new_name) pairs, both relative to
+    target_dir. Existing destination files are never replaced. Returns a
+    list with one entry per rename: None on success, or the OSError that
+    the rename failed with.
+
+    If the ring fails part way through, the renames that finished keep their
+    results. Renames from the chunk that was being submitted get a
+    RenameOutcomeUnknown error, and later ones, which never reached the
+    kernel, get EINVAL so the caller can safely retry them.
+    """
+    # Every rename counts as not attempted until the kernel reports on it.
+    not_attempted = OSError(errno.EINVAL, "Rename was not attempted")
+    results = [not_attempted] * len(renames)
+    completions = []
+    dir_fd = os.open(target_dir, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        ring = Ring()
+        try:
+            for start in range(0, len(renames), ring.sq_entries):
+                chunk = renames[start:start + ring.sq_entries]
+                try:
+                    ring.rename_chunk(dir_fd, chunk, start, completions)
+                except OSError as e:
+                    # Any rename in this chunk may already be with the kernel; the
+                    # completions below overwrite the ones that did report back.
+                    for request_id in range(start, start + len(chunk)):
+                        results[request_id] = RenameOutcomeUnknown(
+                            e.errno, "io_uring failed before reporting this rename", renames[request_id][0])
+                    break
+        finally:
+            ring.close()
+    finally:
+        os.close(dir_fd)
+
+    for request_id, res in completions:
+        if res < 0:
+            err = -res
+            results[request_id] = OSError(err, os.strerror(err), renames[request_id][0])
+        else:
+            results[request_id] = None
+    return results
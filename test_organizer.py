@@ -10,25 +10,74 @@ import unittest
 import tempfile
 import os
 import shutil
+import pathlib
 import json
-from unittest.mock import patch, MagicMock
+import errno
+import types
+import io
+import contextlib
+import logging
+from unittest.mock import patch
 import sys
+import importlib.util
 
-# Add the current directory to the path so we can import organizer
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+def load_module(name):
+    """Loads name.py from next to this file without adding its directory to sys.path.
 
-import organizer
+    The module is registered in sys.modules, so later imports of it (and
+    patch('name.attribute')) find this same module.
+    """
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(os.path.dirname(os.path.abspath(__file__)), name + '.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
 
+# organizer.py imports its io_uring backend by name, so load the backend first;
+# otherwise organizer.organizer_iouring would silently become None here.
+organizer_iouring = load_module('organizer_iouring')
+organizer = load_module('organizer')
 
-class TestFileOrganizer(unittest.TestCase):
+# A logger that discards everything, swapped in for organizer.logger while the tests run.
+null_logger = logging.getLogger('test_null')
+null_logger.addHandler(logging.NullHandler())
+null_logger.propagate = False
+
+
+class OrganizerTestCase(unittest.TestCase):
+    """Base class giving each test its own directory under one temporary root per class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create a shared temporary root and silence the organizer's logger once for the class."""
+        cls._root = tempfile.mkdtemp()
+        cls._logger_patch = patch.object(organizer, 'logger', null_logger)
+        cls._logger_patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary root directory."""
+        cls._logger_patch.stop()
+        shutil.rmtree(cls._root)
+
+    def setUp(self):
+        """Create this test's directory under the shared root."""
+        self.test_dir = os.path.join(self._root, self.id())
+        os.makedirs(self.test_dir)
+        self.config_file = os.path.join(self.test_dir, 'categories.json')
+
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir)
+
+
+class TestFileOrganizer(OrganizerTestCase):
     """Test cases for the file organizer functionality."""
 
     def setUp(self):
         """Set up test environment with temporary directories and files."""
-        # Create a temporary directory for testing
-        self.test_dir = tempfile.mkdtemp()
-        self.original_dir = os.getcwd()
-        os.chdir(self.test_dir)
+        super().setUp()
         
         # Create test files with various extensions
         self.test_files = [
@@ -42,14 +91,10 @@ class TestFileOrganizer(unittest.TestCase):
             'unknown.xyz'
         ]
         
+        # Write each file in binary mode, skipping the text-mode encoding layer
+        payload = b'test content'
         for filename in self.test_files:
-            with open(filename, 'w') as f:
-                f.write('test content')
-
-    def tearDown(self):
-        """Clean up test environment."""
-        os.chdir(self.original_dir)
-        shutil.rmtree(self.test_dir)
+            pathlib.Path(self.test_dir, filename).write_bytes(payload)
 
     def test_get_files_to_organize(self):
         """Test that get_files_to_organize returns correct list of files."""
@@ -60,23 +105,27 @@ class TestFileOrganizer(unittest.TestCase):
         self.assertTrue(len(files) > 0)
         
         # Check that it includes our test files
-        for test_file in self.test_files:
-            self.assertIn(test_file, files)
+        self.assertLessEqual(set(self.test_files), set(files))
 
     def test_get_files_to_organize_nonexistent_dir(self):
         """Test get_files_to_organize with non-existent directory."""
         result = organizer.get_files_to_organize('/nonexistent/directory')
         self.assertIsNone(result)
 
+    def test_get_files_to_organize_file_path(self):
+        """Test get_files_to_organize with a path that is a file, not a directory."""
+        result = organizer.get_files_to_organize(os.path.join(self.test_dir, 'document.pdf'))
+        self.assertIsNone(result)
+
     def test_load_categories_default(self):
         """Test loading categories when no config file exists."""
         # Remove any existing categories.json
-        if os.path.exists('categories.json'):
-            os.remove('categories.json')
+        if os.path.exists(self.config_file):
+            os.remove(self.config_file)
         
         # Since we removed the fallback, this should raise an exception
         with self.assertRaises(FileNotFoundError):
-            organizer.load_categories()
+            organizer.load_categories(self.config_file)
 
     def test_load_categories_from_file(self):
         """Test loading categories from existing config file."""
@@ -85,10 +134,10 @@ class TestFileOrganizer(unittest.TestCase):
             "Images": [".jpg", ".png"]
         }
         
-        with open('categories.json', 'w') as f:
+        with open(self.config_file, 'w') as f:
             json.dump(test_categories, f)
         
-        categories = organizer.load_categories()
+        categories = organizer.load_categories(self.config_file)
         
         self.assertEqual(categories, test_categories)
         self.assertIn('TestCategory', categories)
@@ -97,35 +146,27 @@ class TestFileOrganizer(unittest.TestCase):
     def test_load_categories_invalid_json(self):
         """Test loading categories with invalid JSON file."""
         # Create invalid JSON file
-        with open('categories.json', 'w') as f:
+        with open(self.config_file, 'w') as f:
             f.write('invalid json content {')
         
         # Should raise a JSONDecodeError
         with self.assertRaises(json.JSONDecodeError):
-            organizer.load_categories()
+            organizer.load_categories(self.config_file)
 
-    @patch('organizer.logging.getLogger')
-    def test_list_available_files(self, mock_logger):
+    def test_list_available_files(self):
         """Test the list_available_files function."""
         # Capture print output
-        with patch('builtins.print') as mock_print:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
             organizer.list_available_files(self.test_dir)
-        
-        # Should have printed files
-        mock_print.assert_called()
-        print_calls = [call[0][0] for call in mock_print.call_args_list]
+        output_text = output.getvalue()
         
         # Check that some of our test files were mentioned
-        output_text = ' '.join(print_calls)
         self.assertTrue(any(filename in output_text for filename in self.test_files))
 
-    @patch('organizer.logging.getLogger')
     @patch('organizer.setup_logging')
-    def test_perform_organization_dry_run(self, mock_setup_logging, mock_logger):
+    def test_perform_organization_dry_run(self, mock_setup_logging):
         """Test perform_organization in dry run mode."""
-        mock_logger_instance = MagicMock()
-        mock_logger.return_value = mock_logger_instance
-        
         categories = {
             'Images': ['.jpg'],
             'Documents': ['.pdf'],
@@ -135,13 +176,12 @@ class TestFileOrganizer(unittest.TestCase):
             'Archives': ['.zip']
         }
         
-        with patch('builtins.print') as mock_print:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
             organizer.perform_organization(self.test_dir, is_dry_run=True, categories=categories)
         
         # Should have printed plans without actually moving files
-        mock_print.assert_called()
-        print_calls = [call[0][0] for call in mock_print.call_args_list]
-        output_text = ' '.join(print_calls)
+        output_text = output.getvalue()
         
         self.assertIn('Plan:', output_text)
         
@@ -149,6 +189,176 @@ class TestFileOrganizer(unittest.TestCase):
         for filename in ['document.pdf', 'image.jpg', 'video.mp4']:
             self.assertTrue(os.path.exists(os.path.join(self.test_dir, filename)))
 
+    def test_perform_organization_moves_files(self):
+        """Test perform_organization moves files without overwriting existing ones."""
+        categories = {
+            'Images': ['.jpg'],
+            'Documents': ['.pdf']
+        }
+
+        # Put a different file with the same name in the destination folder already
+        os.makedirs(os.path.join(self.test_dir, 'Images'))
+        with open(os.path.join(self.test_dir, 'Images', 'image.jpg'), 'w') as f:
+            f.write('existing content')
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            organizer.perform_organization(self.test_dir, is_dry_run=False, categories=categories)
+
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'Documents', 'document.pdf')))
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, 'document.pdf')))
+
+        # The existing file must be left alone and the new one skipped
+        with open(os.path.join(self.test_dir, 'Images', 'image.jpg')) as f:
+            self.assertEqual(f.read(), 'existing content')
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'image.jpg')))
+
+        # Files without a matching category stay where they are
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'video.mp4')))
+
+    def test_organizer_uses_iouring_backend(self):
+        """Test organizer picked up the io_uring backend module rather than falling back to None."""
+        self.assertIs(organizer.organizer_iouring, organizer_iouring)
+
+    def test_perform_organization_without_iouring(self):
+        """Test perform_organization moves files on the thread pool when io_uring is unavailable."""
+        categories = {'Images': ['.jpg'], 'Documents': ['.pdf']}
+
+        with patch('organizer.organizer_iouring', None):
+            with contextlib.redirect_stdout(io.StringIO()):
+                organizer.perform_organization(self.test_dir, is_dry_run=False, categories=categories)
+
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'Images', 'image.jpg')))
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'Documents', 'document.pdf')))
+
+    def test_perform_organization_retries_iouring_errors(self):
+        """Test files that io_uring reports as EXDEV or EINVAL are moved again with move_file."""
+        categories = {'Images': ['.jpg'], 'Documents': ['.pdf'], 'Videos': ['.mp4']}
+        retry_errors = {'image.jpg': errno.EXDEV, 'document.pdf': errno.EINVAL}
+
+        def rename_batch(target_dir, renames):
+            results = []
+            for old_name, new_name in renames:
+                if old_name in retry_errors:
+                    results.append(OSError(retry_errors[old_name], os.strerror(retry_errors[old_name]), old_name))
+                else:
+                    os.rename(os.path.join(target_dir, old_name), os.path.join(target_dir, new_name))
+                    results.append(None)
+            return results
+
+        fake_iouring = types.SimpleNamespace(is_available=lambda: True, rename_batch=rename_batch,
+                                             RenameOutcomeUnknown=organizer_iouring.RenameOutcomeUnknown)
+        with patch('organizer.organizer_iouring', fake_iouring):
+            with patch('organizer.move_file', wraps=organizer.move_file) as mock_move_file:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    organizer.perform_organization(self.test_dir, is_dry_run=False, categories=categories)
+
+        retried = sorted(call[0][1] for call in mock_move_file.call_args_list)
+        self.assertEqual(retried, ['document.pdf', 'image.jpg'])
+        for category, filename in [('Images', 'image.jpg'), ('Documents', 'document.pdf'), ('Videos', 'video.mp4')]:
+            self.assertTrue(os.path.exists(os.path.join(self.test_dir, category, filename)))
+
+    def test_move_files_does_not_retry_renames_with_unknown_outcome(self):
+        """Test renames io_uring may have done are checked on disk instead of being retried."""
+        unknown = organizer_iouring.RenameOutcomeUnknown
+        os.makedirs(os.path.join(self.test_dir, 'Images'))
+        os.makedirs(os.path.join(self.test_dir, 'Documents'))
+
+        def rename_batch(target_dir, renames):
+            # The ring failed after the kernel had moved image.jpg but before it moved document.pdf
+            os.rename(os.path.join(target_dir, 'image.jpg'), os.path.join(target_dir, 'Images', 'image.jpg'))
+            return [unknown(errno.EIO, os.strerror(errno.EIO), old_name) for old_name, _ in renames]
+
+        fake_iouring = types.SimpleNamespace(is_available=lambda: True, rename_batch=rename_batch,
+                                             RenameOutcomeUnknown=unknown)
+        with patch('organizer.organizer_iouring', fake_iouring):
+            with patch('organizer.move_file') as mock_move_file:
+                move_errors = organizer.move_files(self.test_dir, [('image.jpg', 'Images'), ('document.pdf', 'Documents')])
+
+        mock_move_file.assert_not_called()
+        self.assertIsNone(move_errors['image.jpg'])
+        self.assertIsInstance(move_errors['document.pdf'], unknown)
+
+    def test_rename_batch_keeps_partial_results(self):
+        """Test rename_batch keeps finished renames and tells apart unknown and unattempted ones."""
+        class FailingRing:
+            sq_entries = 2
+
+            def rename_chunk(self, dir_fd, renames, first_id, results):
+                # The first rename completes, then io_uring_enter() fails
+                results.append((first_id, 0))
+                raise OSError(errno.EIO, os.strerror(errno.EIO))
+
+            def close(self):
+                pass
+
+        renames = [('image.jpg', 'a.jpg'), ('document.pdf', 'b.pdf'), ('video.mp4', 'c.mp4')]
+        with patch.object(organizer_iouring, 'Ring', FailingRing):
+            results = organizer_iouring.rename_batch(self.test_dir, renames)
+
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], organizer_iouring.RenameOutcomeUnknown)
+        self.assertEqual(results[1].errno, errno.EIO)
+        self.assertNotIsInstance(results[2], organizer_iouring.RenameOutcomeUnknown)
+        self.assertEqual(results[2].errno, errno.EINVAL)
+
+    def test_perform_organization_quiet(self):
+        """Test quiet mode only prints problems for individual files."""
+        categories = {'Images': ['.jpg'], 'Documents': ['.pdf']}
+        os.makedirs(os.path.join(self.test_dir, 'Images'))
+        pathlib.Path(self.test_dir, 'Images', 'image.jpg').write_bytes(b'existing content')
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            organizer.perform_organization(self.test_dir, is_dry_run=False, categories=categories, quiet=True)
+        output_text = output.getvalue()
+
+        self.assertIn("SKIPPED: 'image.jpg' already exists", output_text)
+        self.assertNotIn('Moved', output_text)
+        self.assertNotIn('Skipping', output_text)
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'Documents', 'document.pdf')))
+
+    def test_setup_logging_quiet(self):
+        """Test quiet mode keeps INFO records off the console but not out of the log file."""
+        for quiet, console_level in [(False, logging.NOTSET), (True, logging.WARNING)]:
+            with self.subTest(quiet=quiet):
+                with patch('organizer.os.path.exists', return_value=True), \
+                     patch('organizer.logging.FileHandler') as mock_file_handler, \
+                     patch('organizer.logging.basicConfig') as mock_basic_config:
+                    organizer.setup_logging(quiet=quiet)
+
+                file_handler, console_handler = mock_basic_config.call_args.kwargs['handlers']
+                self.assertIs(file_handler, mock_file_handler.return_value)
+                file_handler.setLevel.assert_not_called()
+                self.assertIsInstance(console_handler, logging.StreamHandler)
+                self.assertEqual(console_handler.level, console_level)
+                self.assertEqual(mock_basic_config.call_args.kwargs['level'], logging.INFO)
+
+    def test_perform_organization_creates_each_folder_once(self):
+        """Test perform_organization creates each category folder once, not once per file."""
+        categories = {'Images': ['.jpg', '.png'], 'Documents': ['.pdf']}
+        for filename in ['photo.png', 'second.jpg']:
+            pathlib.Path(self.test_dir, filename).write_bytes(b'test content')
+
+        with patch('organizer.os.makedirs', wraps=os.makedirs) as mock_makedirs:
+            with contextlib.redirect_stdout(io.StringIO()):
+                organizer.perform_organization(self.test_dir, is_dry_run=False, categories=categories)
+
+        created = sorted(call[0][0] for call in mock_makedirs.call_args_list)
+        self.assertEqual(created, [os.path.join(self.test_dir, 'Documents'), os.path.join(self.test_dir, 'Images')])
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'Images', 'second.jpg')))
+
+    def test_move_file_cross_device(self):
+        """Test move_file copies and deletes without trying a rename when the folder is on another drive."""
+        os.makedirs(os.path.join(self.test_dir, 'Images'))
+
+        with patch('organizer.os.rename') as mock_rename:
+            organizer.move_file(self.test_dir, 'image.jpg', 'Images', cross_device=True)
+        mock_rename.assert_not_called()
+
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, 'image.jpg')))
+        with open(os.path.join(self.test_dir, 'Images', 'image.jpg'), 'rb') as f:
+            self.assertEqual(f.read(), b'test content')
+
     def test_file_extension_categorization(self):
         """Test that files are categorized correctly by extension."""
         # Create a minimal categories.json for testing
@@ -161,10 +371,11 @@ class TestFileOrganizer(unittest.TestCase):
             "Archives": [".zip"]
         }
         
-        with open('categories.json', 'w') as f:
+        with open(self.config_file, 'w') as f:
             json.dump(test_categories, f)
         
-        categories = organizer.load_categories()
+        categories = organizer.load_categories(self.config_file)
+        extension_index = organizer.build_extension_index(categories)
         
         # Test some known extensions
         test_cases = [
@@ -177,61 +388,67 @@ class TestFileOrganizer(unittest.TestCase):
         ]
         
         for extension, expected_category in test_cases:
-            found_category = None
-            for category, extensions in categories.items():
-                if extension in extensions:
-                    found_category = category
-                    break
-            
+            found_category = extension_index.get(extension)
             self.assertEqual(found_category, expected_category, 
                            f"Extension {extension} should be in {expected_category}")
 
-    @patch('organizer.logging.getLogger')
+    def test_get_file_extension(self):
+        """Test get_file_extension agrees with os.path.splitext, including dotfiles."""
+        names = ['photo.JPG', 'archive.tar.gz', 'noextension', '.gitignore', '..foo',
+                 'a.', '...', 'a..b', '.hidden.TXT', 'Mixed.PdF']
+        for name in names:
+            with self.subTest(name=name):
+                self.assertEqual(organizer.get_file_extension(name), os.path.splitext(name)[1].lower())
+
+    def test_build_extension_index(self):
+        """Test the extension index keeps the first category and ignores case."""
+        categories = {
+            "Documents": [".pdf", ".PPT"],
+            "Presentations": [".ppt", ".key"]
+        }
+
+        index = organizer.build_extension_index(categories)
+
+        self.assertEqual(index['.pdf'], 'Documents')
+        self.assertEqual(index['.ppt'], 'Documents')
+        self.assertEqual(index['.key'], 'Presentations')
+        self.assertNotIn('.PPT', index)
+
     @patch('organizer.setup_logging')
-    def test_get_target_dir_from_user_valid(self, mock_setup_logging, mock_logger):
+    def test_get_target_dir_from_user_valid(self, mock_setup_logging):
         """Test get_target_dir_from_user with valid directory."""
         with patch('builtins.input', return_value=self.test_dir):
             result = organizer.get_target_dir_from_user()
         
         self.assertEqual(result, self.test_dir)
 
-    @patch('organizer.logging.getLogger')
     @patch('organizer.setup_logging')
-    def test_get_target_dir_from_user_invalid(self, mock_setup_logging, mock_logger):
+    def test_get_target_dir_from_user_invalid(self, mock_setup_logging):
         """Test get_target_dir_from_user with invalid directory."""
         with patch('builtins.input', return_value='/nonexistent/directory'):
-            with patch('builtins.print'):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
                 result = organizer.get_target_dir_from_user()
         
         self.assertIsNone(result)
+        self.assertIn('does not exist', output.getvalue())
 
 
-class TestConfigurationManagement(unittest.TestCase):
+class TestConfigurationManagement(OrganizerTestCase):
     """Test cases for configuration file management."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.original_dir = os.getcwd()
-        os.chdir(self.test_dir)
-
-    def tearDown(self):
-        """Clean up test environment."""
-        os.chdir(self.original_dir)
-        shutil.rmtree(self.test_dir)
-
     def test_config_file_creation(self):
         """Test behavior when config file doesn't exist."""
         # Ensure no config file exists
-        if os.path.exists('categories.json'):
-            os.remove('categories.json')
+        if os.path.exists(self.config_file):
+            os.remove(self.config_file)
         
         # Since we removed auto-creation, this should raise an exception
         with self.assertRaises(FileNotFoundError):
-            organizer.load_categories()
+            organizer.load_categories(self.config_file)
         
         # Config file should not be created automatically anymore
-        self.assertFalse(os.path.exists('categories.json'))
+        self.assertFalse(os.path.exists(self.config_file))
 
     def test_custom_category_addition(self):
         """Test adding custom categories to config file."""
@@ -241,14 +458,46 @@ class TestConfigurationManagement(unittest.TestCase):
             "Documents": [".pdf", ".doc"]
         }
         
-        with open('categories.json', 'w') as f:
+        with open(self.config_file, 'w') as f:
             json.dump(custom_categories, f)
         
-        loaded_categories = organizer.load_categories()
+        loaded_categories = organizer.load_categories(self.config_file)
         
         self.assertIn('CustomCategory', loaded_categories)
         self.assertEqual(loaded_categories['CustomCategory'], [".custom", ".special"])
 
+    def test_load_categories_with_bom(self):
+        """Test a config saved as UTF-8 with a byte order mark loads with either JSON parser."""
+        categories = {"Images": [".jpg"], "Documents": [".pdf"]}
+        with open(self.config_file, 'wb') as f:
+            f.write(b'\xef\xbb\xbf' + json.dumps(categories).encode('utf-8'))
+
+        for json_loads in [organizer.json_loads, json.loads]:
+            with self.subTest(json_loads=json_loads):
+                organizer.read_categories_file.cache_clear()
+                with patch('organizer.json_loads', json_loads):
+                    self.assertEqual(organizer.load_categories(self.config_file), categories)
+
+    def test_categories_cache(self):
+        """Test that parsed categories are cached and refreshed when the config changes."""
+        with open(self.config_file, 'w') as f:
+            json.dump({"Images": [".jpg"]}, f)
+
+        first = organizer.load_categories(self.config_file)
+
+        # A second load is served from memory without reading the file again
+        with patch('builtins.open') as mock_open:
+            second = organizer.load_categories(self.config_file)
+        mock_open.assert_not_called()
+        self.assertEqual(first, second)
+
+        # Changing the config file invalidates the cache
+        with open(self.config_file, 'w') as f:
+            json.dump({"Images": [".jpg", ".png"], "Documents": [".pdf"]}, f)
+        os.utime(self.config_file, ns=(0, 0))
+
+        self.assertEqual(organizer.load_categories(self.config_file), {"Images": [".jpg", ".png"], "Documents": [".pdf"]})
+
 
 if __name__ == '__main__':
     # Run the tests